@@ -1,11 +1,10 @@
 """Support for interacting with Snapcast clients."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import socket
 
-import snapcast.control
-from snapcast.control.server import CONTROL_PORT
 import voluptuous as vol
 
 from homeassistant.components.media_player import (
@@ -15,7 +14,7 @@ from homeassistant.components.media_player import (
     MediaPlayerState,
 )
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
@@ -37,10 +36,25 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+PARALLEL_UPDATES = 0
+
+# snapcast.control.server.CONTROL_PORT, inlined so the schema holds the
+# default and the library import can stay lazy.
+DEFAULT_PORT = 1705
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
-    {vol.Required(CONF_HOST): cv.string, vol.Optional(CONF_PORT): cv.port}
+    {
+        vol.Required(CONF_HOST): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(CONF_PORT, default=DEFAULT_PORT): cv.port,
+    }
 )
 
+STREAM_STATUS_TO_STATE = {
+    "idle": MediaPlayerState.IDLE,
+    "playing": MediaPlayerState.PLAYING,
+    "unknown": None,
+}
+
 
 async def async_setup_platform(
     hass: HomeAssistant,
@@ -50,62 +64,59 @@ async def async_setup_platform(
 ) -> None:
     """Set up the Snapcast platform."""
 
-    host = config.get(CONF_HOST)
-    port = config.get(CONF_PORT, CONTROL_PORT)
+    # Imported here so HA's cold-start component scan does not pay for the
+    # snapcast library when the platform is not configured.
+    import snapcast.control  # pylint: disable=import-outside-toplevel
+
+    hosts = config.get(CONF_HOST)
+    port = config[CONF_PORT]
 
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(SERVICE_SNAPSHOT, {}, "snapshot")
     platform.async_register_entity_service(SERVICE_RESTORE, {}, "async_restore")
     platform.async_register_entity_service(
-        SERVICE_JOIN, {vol.Required(ATTR_MASTER): cv.entity_id}, handle_async_join
+        SERVICE_JOIN, {vol.Required(ATTR_MASTER): cv.entity_id}, "async_join"
     )
-    platform.async_register_entity_service(SERVICE_UNJOIN, {}, handle_async_unjoin)
+    platform.async_register_entity_service(SERVICE_UNJOIN, {}, "async_unjoin")
     platform.async_register_entity_service(
         SERVICE_SET_LATENCY,
         {vol.Required(ATTR_LATENCY): cv.positive_int},
-        handle_set_latency,
+        "async_set_latency",
+    )
+
+    servers = await asyncio.gather(
+        *(
+            snapcast.control.create_server(hass.loop, host, port, reconnect=True)
+            for host in hosts
+        ),
+        return_exceptions=True,
     )
 
-    try:
-        server = await snapcast.control.create_server(
-            hass.loop, host, port, reconnect=True
+    devices: list[MediaPlayerEntity] = []
+    for host, server in zip(hosts, servers):
+        if isinstance(server, socket.gaierror):
+            _LOGGER.error("Could not connect to Snapcast server at %s:%d", host, port)
+            continue
+        if isinstance(server, BaseException):
+            raise server
+
+        # Note: Host part is needed, when using multiple snapservers
+        hpid = f"{host}:{port}"
+        group_uid_prefix = f"{GROUP_PREFIX}{hpid}_"
+        client_uid_prefix = f"{CLIENT_PREFIX}{hpid}_"
+
+        devices.extend(
+            SnapcastGroupDevice(group, group_uid_prefix) for group in server.groups
         )
-    except socket.gaierror:
-        _LOGGER.error("Could not connect to Snapcast server at %s:%d", host, port)
-        return
-
-    # Note: Host part is needed, when using multiple snapservers
-    hpid = f"{host}:{port}"
-
-    devices: list[MediaPlayerEntity] = [
-        SnapcastGroupDevice(group, hpid) for group in server.groups
-    ]
-    devices.extend(SnapcastClientDevice(client, hpid) for client in server.clients)
-    hass.data[DATA_KEY] = devices
+        devices.extend(
+            SnapcastClientDevice(client, client_uid_prefix)
+            for client in server.clients
+        )
+    data = hass.data.setdefault(DATA_KEY, {"devices": [], "by_entity_id": {}})
+    data["devices"].extend(devices)
     async_add_entities(devices)
 
 
-async def handle_async_join(entity, service_call):
-    """Handle the entity service join."""
-    if not isinstance(entity, SnapcastClientDevice):
-        raise TypeError("Entity is not a client. Can only join clients.")
-    await entity.async_join(service_call.data[ATTR_MASTER])
-
-
-async def handle_async_unjoin(entity, service_call):
-    """Handle the entity service unjoin."""
-    if not isinstance(entity, SnapcastClientDevice):
-        raise TypeError("Entity is not a client. Can only unjoin clients.")
-    await entity.async_unjoin()
-
-
-async def handle_set_latency(entity, service_call):
-    """Handle the entity service set_latency."""
-    if not isinstance(entity, SnapcastClientDevice):
-        raise TypeError("Latency can only be set for a Snapcast client.")
-    await entity.async_set_latency(service_call.data[ATTR_LATENCY])
-
-
 class SnapcastGroupDevice(MediaPlayerEntity):
     """Representation of a Snapcast group device."""
 
@@ -116,37 +127,64 @@ class SnapcastGroupDevice(MediaPlayerEntity):
         | MediaPlayerEntityFeature.SELECT_SOURCE
     )
 
-    def __init__(self, group, uid_part):
+    def __init__(self, group, uid_prefix):
         """Initialize the Snapcast group device."""
         self._group = group
-        self._uid = f"{GROUP_PREFIX}{uid_part}_{self._group.identifier}"
+        # The prefix carries the host part, needed with multiple snapservers
+        self._attr_unique_id = uid_prefix + group.identifier
+        self._attr_name = GROUP_PREFIX + group.identifier
+        self._streams_cache = None
+        self._source_list = None
+        self._friendly_name = None
+        self._last_state_hash = None
+        self._update_pending = False
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to group events."""
-        self._group.set_callback(self.schedule_update_ha_state)
+        self._group.set_callback(self._on_update)
+        self.hass.data[DATA_KEY]["by_entity_id"][self.entity_id] = self
 
     async def async_will_remove_from_hass(self) -> None:
         """Disconnect group object when removed."""
         self._group.set_callback(None)
+        self.hass.data[DATA_KEY]["by_entity_id"].pop(self.entity_id, None)
+
+    def _on_update(self):
+        """Invalidate cached state and update the entity."""
+        self._streams_cache = None
+        self._source_list = None
+        self._friendly_name = None
+        self._last_state_hash = None
+        if self._update_pending:
+            return
+        self._update_pending = True
+        self.hass.loop.call_soon(self._flush_update)
+
+    def _flush_update(self):
+        """Write the coalesced state update."""
+        self._update_pending = False
+        self.schedule_update_ha_state()
+
+    def _streams(self):
+        """Return the available streams, keyed by name."""
+        if self._streams_cache is None:
+            self._streams_cache = self._group.streams_by_name()
+        return self._streams_cache
+
+    def _maybe_write_state(self):
+        """Write HA state unless nothing changed since the last write."""
+        state_hash = hash(
+            (self.state, self.volume_level, self.is_volume_muted, self.source)
+        )
+        if state_hash == self._last_state_hash:
+            return
+        self._last_state_hash = state_hash
+        self.async_write_ha_state()
 
     @property
     def state(self) -> MediaPlayerState | None:
         """Return the state of the player."""
-        return {
-            "idle": MediaPlayerState.IDLE,
-            "playing": MediaPlayerState.PLAYING,
-            "unknown": None,
-        }.get(self._group.stream_status)
-
-    @property
-    def unique_id(self):
-        """Return the ID of snapcast group."""
-        return self._uid
-
-    @property
-    def name(self):
-        """Return the name of the device."""
-        return f"{GROUP_PREFIX}{self._group.identifier}"
+        return STREAM_STATUS_TO_STATE.get(self._group.stream_status)
 
     @property
     def source(self):
@@ -166,31 +204,35 @@ class SnapcastGroupDevice(MediaPlayerEntity):
     @property
     def source_list(self):
         """List of available input sources."""
-        return list(self._group.streams_by_name().keys())
+        if self._source_list is None:
+            self._source_list = list(self._streams())
+        return self._source_list
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        name = f"{self._group.friendly_name} {GROUP_SUFFIX}"
-        return {"friendly_name": name}
+        if self._friendly_name is None:
+            self._friendly_name = f"{self._group.friendly_name} {GROUP_SUFFIX}"
+        return {"friendly_name": self._friendly_name}
 
     async def async_select_source(self, source: str) -> None:
         """Set input source."""
-        streams = self._group.streams_by_name()
+        streams = self._streams()
         if source in streams:
             await self._group.set_stream(streams[source].identifier)
-            self.async_write_ha_state()
+            self._maybe_write_state()
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Send the mute command."""
         await self._group.set_muted(mute)
-        self.async_write_ha_state()
+        self._maybe_write_state()
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set the volume level."""
         await self._group.set_volume(round(volume * 100))
-        self.async_write_ha_state()
+        self._maybe_write_state()
 
+    @callback
     def snapshot(self):
         """Snapshot the group state."""
         self._group.snapshot()
@@ -198,7 +240,19 @@ class SnapcastGroupDevice(MediaPlayerEntity):
     async def async_restore(self):
         """Restore the group state."""
         await self._group.restore()
-        self.async_write_ha_state()
+        self._maybe_write_state()
+
+    async def async_join(self, master):
+        """Reject join for groups; only clients can join."""
+        raise TypeError("Entity is not a client. Can only join clients.")
+
+    async def async_unjoin(self):
+        """Reject unjoin for groups; only clients can unjoin."""
+        raise TypeError("Entity is not a client. Can only unjoin clients.")
+
+    async def async_set_latency(self, latency):
+        """Reject set_latency for groups; latency is a client setting."""
+        raise TypeError("Latency can only be set for a Snapcast client.")
 
 
 class SnapcastClientDevice(MediaPlayerEntity):
@@ -211,38 +265,71 @@ class SnapcastClientDevice(MediaPlayerEntity):
         | MediaPlayerEntityFeature.SELECT_SOURCE
     )
 
-    def __init__(self, client, uid_part):
+    def __init__(self, client, uid_prefix):
         """Initialize the Snapcast client device."""
         self._client = client
-        self._uid = f"{CLIENT_PREFIX}{uid_part}_{self._client.identifier}"
+        # The prefix carries the host part, needed with multiple snapservers
+        self._attr_unique_id = uid_prefix + client.identifier
+        self._attr_name = CLIENT_PREFIX + client.identifier
+        self._streams_cache = None
+        self._source_list = None
+        self._friendly_name = None
+        self._last_state_hash = None
+        self._update_pending = False
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to client events."""
-        self._client.set_callback(self.schedule_update_ha_state)
+        self._client.set_callback(self._on_update)
+        self.hass.data[DATA_KEY]["by_entity_id"][self.entity_id] = self
 
     async def async_will_remove_from_hass(self) -> None:
         """Disconnect client object when removed."""
         self._client.set_callback(None)
-
-    @property
-    def unique_id(self):
-        """
-        Return the ID of this snapcast client.
-
-        Note: Host part is needed, when using multiple snapservers
-        """
-        return self._uid
+        self.hass.data[DATA_KEY]["by_entity_id"].pop(self.entity_id, None)
+
+    def _on_update(self):
+        """Invalidate cached state and update the entity."""
+        self._streams_cache = None
+        self._source_list = None
+        self._friendly_name = None
+        self._last_state_hash = None
+        if self._update_pending:
+            return
+        self._update_pending = True
+        self.hass.loop.call_soon(self._flush_update)
+
+    def _flush_update(self):
+        """Write the coalesced state update."""
+        self._update_pending = False
+        self.schedule_update_ha_state()
+
+    def _streams(self):
+        """Return the available streams, keyed by name."""
+        if self._streams_cache is None:
+            self._streams_cache = self._client.group.streams_by_name()
+        return self._streams_cache
+
+    def _maybe_write_state(self):
+        """Write HA state unless nothing changed since the last write."""
+        state_hash = hash(
+            (
+                self.state,
+                self.volume_level,
+                self.is_volume_muted,
+                self.source,
+                self.latency,
+            )
+        )
+        if state_hash == self._last_state_hash:
+            return
+        self._last_state_hash = state_hash
+        self.async_write_ha_state()
 
     @property
     def identifier(self):
         """Return the snapcast identifier."""
         return self._client.identifier
 
-    @property
-    def name(self):
-        """Return the name of the device."""
-        return f"{CLIENT_PREFIX}{self._client.identifier}"
-
     @property
     def source(self):
         """Return the current input source."""
@@ -261,7 +348,9 @@ class SnapcastClientDevice(MediaPlayerEntity):
     @property
     def source_list(self):
         """List of available input sources."""
-        return list(self._client.group.streams_by_name().keys())
+        if self._source_list is None:
+            self._source_list = list(self._streams())
+        return self._source_list
 
     @property
     def state(self) -> MediaPlayerState:
@@ -273,11 +362,11 @@ class SnapcastClientDevice(MediaPlayerEntity):
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        state_attrs = {}
-        if self.latency is not None:
-            state_attrs["latency"] = self.latency
-        name = f"{self._client.friendly_name} {CLIENT_SUFFIX}"
-        state_attrs["friendly_name"] = name
+        if self._friendly_name is None:
+            self._friendly_name = f"{self._client.friendly_name} {CLIENT_SUFFIX}"
+        state_attrs = {"friendly_name": self._friendly_name}
+        if (latency := self.latency) is not None:
+            state_attrs["latency"] = latency
         return state_attrs
 
     @property
@@ -287,43 +376,45 @@ class SnapcastClientDevice(MediaPlayerEntity):
 
     async def async_select_source(self, source: str) -> None:
         """Set input source."""
-        streams = self._client.group.streams_by_name()
+        streams = self._streams()
         if source in streams:
             await self._client.group.set_stream(streams[source].identifier)
-            self.async_write_ha_state()
+            self._maybe_write_state()
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Send the mute command."""
         await self._client.set_muted(mute)
-        self.async_write_ha_state()
+        self._maybe_write_state()
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set the volume level."""
         await self._client.set_volume(round(volume * 100))
-        self.async_write_ha_state()
+        self._maybe_write_state()
 
     async def async_join(self, master):
         """Join the group of the master player."""
 
-        master_entity = next(
-            entity for entity in self.hass.data[DATA_KEY] if entity.entity_id == master
-        )
+        master_entity = self.hass.data[DATA_KEY]["by_entity_id"].get(master)
+        if master_entity is None:
+            raise KeyError(f"Master entity {master} not found")
         if not isinstance(master_entity, SnapcastClientDevice):
             raise TypeError("Master is not a client device. Can only join clients.")
 
+        master_id = master_entity.identifier
         master_group = next(
             group
             for group in self._client.groups_available()
-            if master_entity.identifier in group.clients
+            if master_id in group.clients
         )
         await master_group.add_client(self._client.identifier)
-        self.async_write_ha_state()
+        self._maybe_write_state()
 
     async def async_unjoin(self):
         """Unjoin the group the player is currently in."""
         await self._client.group.remove_client(self._client.identifier)
-        self.async_write_ha_state()
+        self._maybe_write_state()
 
+    @callback
     def snapshot(self):
         """Snapshot the client state."""
         self._client.snapshot()
@@ -331,9 +422,9 @@ class SnapcastClientDevice(MediaPlayerEntity):
     async def async_restore(self):
         """Restore the client state."""
         await self._client.restore()
-        self.async_write_ha_state()
+        self._maybe_write_state()
 
     async def async_set_latency(self, latency):
         """Set the latency of the client."""
         await self._client.set_latency(latency)
-        self.async_write_ha_state()
+        self._maybe_write_state()
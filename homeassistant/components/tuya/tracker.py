@@ -1,13 +1,18 @@
 """Support for Tuya LaView Trackers."""
 from __future__ import annotations
 
+import asyncio
+from types import MappingProxyType
 from typing import Any
 
 from tuya_iot import TuyaDevice, TuyaDeviceManager
 
 from homeassistant.components.tracker import (
-
+    StateTrackerEntity,
+    TrackerEntityFeature,
+    TrackingEntityFeature,
 )
+from homeassistant.components.vacuum import VacuumEntityFeature
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_IDLE, STATE_PAUSED
 from homeassistant.core import HomeAssistant, callback
@@ -16,7 +21,26 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import HomeAssistantTuyaData
 from .base import EnumTypeData, IntegerTypeData, TuyaEntity
-from .const import DOMAIN, TUYA_DISCOVERY_NEW, DPCode, DPType
+from .const import DOMAIN, LOGGER, TUYA_DISCOVERY_NEW, DPCode, DPType
+
+# Commands issued within this window are sent as one cloud request per device.
+COMMAND_FLUSH_DELAY = 0.05
+
+TUYA_MODE_RETURN_HOME = "chargego"
+TUYA_STATUS_TO_HA = MappingProxyType(
+    {
+        "paused": STATE_PAUSED,
+        "sleep": STATE_IDLE,
+        "standby": STATE_IDLE,
+    }
+)
+
+# Supported-feature bitmasks keyed by device model signature, so trackers of
+# the same model skip the per-dpcode probing. Only the bitmask is cached;
+# EnumTypeData/IntegerTypeData are re-derived per device since specs can
+# differ (scale, enum range) between devices with identical dpcode keys.
+_FEATURES_CACHE: dict[tuple, int] = {}
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -27,12 +51,13 @@ async def async_setup_entry(
     @callback
     def async_discover_device(device_ids: list[str]) -> None:
         """Discover and add a discovered Tuya tracker."""
-        entities: list[TuyaTrackerEntity] = []
-        for device_id in device_ids:
-            device = hass_data.device_manager.device_map[device_id]
-            if device.category == "tracker":
-                entities.append(TuyaTrackerEntity(device, hass_data.device_manager))
-        async_add_entities(entities)
+        device_map = hass_data.device_manager.device_map
+        async_add_entities(
+            TuyaTrackerEntity(device, hass_data.device_manager)
+            for device_id in device_ids
+            if (device := device_map.get(device_id)) is not None
+            and device.category == "tracker"
+        )
 
     async_discover_device([*hass_data.device_manager.device_map])
 
@@ -46,6 +71,10 @@ class TuyaTrackerEntity(TuyaEntity, StateTrackerEntity):
     """Below is mostly still vacuum template..."""
     
     _battery_level: IntegerTypeData | None = None
+    _tracking_mode: EnumTypeData | None = None
+
+    _pending_commands: dict[str, tuple[TuyaDeviceManager, list[dict[str, Any]]]] = {}
+    _flush_scheduled = False
 
     def __init__(self, device: TuyaDevice, device_manager: TuyaDeviceManager) -> None:
         """Init Tuya vacuum."""
@@ -53,11 +82,53 @@ class TuyaTrackerEntity(TuyaEntity, StateTrackerEntity):
 
         self._attr_fan_speed_list = []
 
+        sig = (
+            device.category,
+            tuple(sorted(device.function)),
+            tuple(sorted(device.status_range)),
+        )
+        if (features := _FEATURES_CACHE.get(sig)) is not None:
+            # RETURN_HOME can depend on the MODE enum's values, which the
+            # key-based signature does not capture; re-derive it per device.
+            features &= ~VacuumEntityFeature.RETURN_HOME
+            if self.find_dpcode(DPCode.SWITCH_CHARGE, prefer_function=True):
+                features |= VacuumEntityFeature.RETURN_HOME
+            elif (
+                enum_type := self.find_dpcode(
+                    DPCode.MODE, dptype=DPType.ENUM, prefer_function=True
+                )
+            ) and TUYA_MODE_RETURN_HOME in enum_type.range:
+                features |= VacuumEntityFeature.RETURN_HOME
+            self._attr_supported_features |= features
+            if features & TrackingEntityFeature.TRMODE and (
+                enum_type := self.find_dpcode(
+                    DPCode.TRMODE, dptype=DPType.ENUM, prefer_function=True
+                )
+            ):
+                self._tracking_mode = enum_type
+                self._attr_tracking_mode = enum_type.range
+            if features & VacuumEntityFeature.BATTERY:
+                self._battery_level = self.find_dpcode(
+                    DPCode.ELECTRICITY_LEFT, dptype=DPType.INTEGER
+                )
+            return
+
+        dpcode_cache = {
+            dpcode: self.find_dpcode(dpcode, prefer_function=True)
+            for dpcode in (
+                DPCode.PAUSE,
+                DPCode.SWITCH_CHARGE,
+                DPCode.STATUS,
+                DPCode.POWER,
+                DPCode.POWER_GO,
+            )
+        }
+
         self._attr_supported_features |= VacuumEntityFeature.SEND_COMMAND
-        if self.find_dpcode(DPCode.PAUSE, prefer_function=True):
+        if dpcode_cache[DPCode.PAUSE]:
             self._attr_supported_features |= VacuumEntityFeature.PAUSE
 
-        if self.find_dpcode(DPCode.SWITCH_CHARGE, prefer_function=True):
+        if dpcode_cache[DPCode.SWITCH_CHARGE]:
             self._attr_supported_features |= VacuumEntityFeature.RETURN_HOME
         elif (
             enum_type := self.find_dpcode(
@@ -69,17 +140,17 @@ class TuyaTrackerEntity(TuyaEntity, StateTrackerEntity):
         if self.find_dpcode(DPCode.FINDDEV, prefer_function=False):
             self._attr_supported_features |= TrackerEntityFeature.FINDDEV
 
-        if self.find_dpcode(DPCode.STATUS, prefer_function=True):
+        if dpcode_cache[DPCode.STATUS]:
             self._attr_supported_features |= (
                 VacuumEntityFeature.STATE | VacuumEntityFeature.STATUS
             )
 
-        if self.find_dpcode(DPCode.POWER, prefer_function=True):
+        if dpcode_cache[DPCode.POWER]:
             self._attr_supported_features |= (
                 VacuumEntityFeature.TURN_ON | VacuumEntityFeature.TURN_OFF
             )
 
-        if self.find_dpcode(DPCode.POWER_GO, prefer_function=True):
+        if dpcode_cache[DPCode.POWER_GO]:
             self._attr_supported_features |= (
                 VacuumEntityFeature.STOP | VacuumEntityFeature.START
             )
@@ -95,6 +166,8 @@ class TuyaTrackerEntity(TuyaEntity, StateTrackerEntity):
             self._attr_supported_features |= VacuumEntityFeature.BATTERY
             self._battery_level = int_type
 
+        _FEATURES_CACHE[sig] = self._attr_supported_features
+
     @property
     def battery_level(self) -> int | None:
         """Return Tuya device state."""
@@ -112,18 +185,58 @@ class TuyaTrackerEntity(TuyaEntity, StateTrackerEntity):
     @property
     def state(self) -> str | None:
         """Return Tuya tracker SOS state."""
-        if self.device.status.get(DPCode.PAUSE) and not (
-            self.device.status.get(DPCode.STATUS)
-        ):
+        status_map = self.device.status
+        status = status_map.get(DPCode.STATUS)
+        if status_map.get(DPCode.PAUSE) and not status:
             return STATE_PAUSED
-        if not (status := self.device.status.get(DPCode.STATUS)):
+        if not status:
             return None
         return TUYA_STATUS_TO_HA.get(status)
 
+    def _send_command(self, commands: list[dict[str, Any]]) -> None:
+        """Queue commands so one flush window becomes one request per device."""
+        # Command methods run on executor threads; marshal the enqueue onto
+        # the event loop so the queue and flush flag are only touched there.
+        self.hass.loop.call_soon_threadsafe(
+            self._queue_commands, self.device.id, commands
+        )
+
+    @callback
+    def _queue_commands(self, device_id: str, commands: list[dict[str, Any]]) -> None:
+        """Add commands to the pending queue and arm the flush."""
+        # The queue is shared by every config entry, so each batch records the
+        # device manager owning the device and is flushed through it.
+        pending = TuyaTrackerEntity._pending_commands
+        pending.setdefault(device_id, (self.device_manager, []))[1].extend(commands)
+        if not TuyaTrackerEntity._flush_scheduled:
+            TuyaTrackerEntity._flush_scheduled = True
+            self.hass.loop.call_later(COMMAND_FLUSH_DELAY, self._flush_commands)
+
+    @callback
+    def _flush_commands(self) -> None:
+        """Send all queued commands, one cloud request per device."""
+        pending = TuyaTrackerEntity._pending_commands
+        TuyaTrackerEntity._pending_commands = {}
+        TuyaTrackerEntity._flush_scheduled = False
+        for device_id, (device_manager, commands) in pending.items():
+            LOGGER.debug("Sending commands for device %s: %s", device_id, commands)
+            future = self.hass.async_add_executor_job(
+                device_manager.send_commands, device_id, commands
+            )
+            future.add_done_callback(self._log_command_result)
+
+    @staticmethod
+    def _log_command_result(future: asyncio.Future) -> None:
+        """Log failures from a flushed command batch."""
+        if not future.cancelled() and (exc := future.exception()):
+            LOGGER.error("Error sending Tuya tracker commands: %s", exc)
+
+    @callback
     def turn_on(self, **kwargs: Any) -> None:
         """Turn the device on."""
         self._send_command([{"code": DPCode.POWER, "value": True}])
 
+    @callback
     def return_to_base(self, **kwargs: Any) -> None:
         """Return device to dock."""
         self._send_command(
@@ -133,14 +246,17 @@ class TuyaTrackerEntity(TuyaEntity, StateTrackerEntity):
             ]
         )
 
+    @callback
     def locate(self, **kwargs: Any) -> None:
         """Locate the device."""
         self._send_command([{"code": DPCode.FINDDEV, "value": True}])
 
+    @callback
     def set_tracking_mode(self, tracking_mode: str, **kwargs: Any) -> None:
         """Set tracker mode."""
         self._send_command([{"code": DPCode.TRMODE, "value": tracking_mode}])
 
+    @callback
     def send_command(
         self, command: str, params: dict | list | None = None, **kwargs: Any
     ) -> None: